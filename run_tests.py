@@ -2,61 +2,138 @@
 """
 Test runner script for the FastAPI application tests
 """
-import subprocess
+import argparse
+import contextlib
+import importlib.util
+import io
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-def run_command(command, description):
-    """Run a command and print its output"""
-    print(f"\n{'='*60}")
-    print(f"Running: {description}")
-    print(f"Command: {command}")
-    print('='*60)
+import pytest
+
+# Test modules run as separate shards when pytest-xdist is unavailable
+TEST_FILES = [
+    "tests/test_api.py",
+    "tests/test_edge_cases.py",
+    "tests/test_static_files.py",
+]
+
+# Plugin entry-point autoloading is disabled in main(), so the plugins
+# the suite needs are loaded explicitly and unused built-ins are switched off
+PLUGIN_ARGS = (
+    "-p", "pytest_asyncio.plugin",
+    "-p", "no:cacheprovider",
+    "-p", "no:stepwise",
+)
+
+# Pre-built pytest argv tuples
+PARALLEL_ARGS = ("tests/", *PLUGIN_ARGS, "-p", "xdist.plugin", "-n", "auto", "--dist", "loadgroup")
+COVERAGE_ARGS = ("-p", "pytest_cov.plugin", "--cov=src", "--cov-report=term-missing")
+SHARD_ARGS = tuple((test_file, *PLUGIN_ARGS) for test_file in TEST_FILES)
+
+def run_command(args, description, verbose=False):
+    """Run pytest in-process with the given arguments"""
+    if verbose:
+        print(f"\n{'='*60}")
+        print(f"Running: {description}")
+        print(f"Command: pytest {' '.join(args)}")
+        print('='*60)
     
-    result = subprocess.run(command, shell=True, capture_output=False)
-    return result.returncode == 0
+    return pytest.main(list(args)) == 0
+
+def run_command_buffered(args, description, verbose=False):
+    """Run a command with its output buffered, for running in a worker process"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        success = run_command(args, description, verbose)
+    return success, output.getvalue()
 
 def main():
     """Main test runner function"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--verbose", action="store_true",
+                        help="print a header before each test command")
+    parser.add_argument("-x", "--exitfirst", action="store_true",
+                        help="stop at the first failing test")
+    parser.add_argument("--coverage", action="store_true",
+                        help="collect a coverage report for src/ (slower)")
+    args = parser.parse_args()
+    
     # Change to project directory
     project_root = os.path.dirname(os.path.abspath(__file__))
     os.chdir(project_root)
     
-    # Python executable path
-    python_exe = os.path.join(project_root, '.venv', 'bin', 'python')
-    
     print("FastAPI Test Runner")
     print("="*60)
     
+    # Load only the plugins named in PLUGIN_ARGS; xdist workers and pool
+    # processes inherit this environment
+    os.environ["PYTEST_DISABLE_PLUGIN_AUTOLOAD"] = "1"
+    
+    if args.coverage and sys.version_info >= (3, 12):
+        # sys.monitoring-based tracing is much cheaper than settrace
+        os.environ.setdefault("COVERAGE_CORE", "sysmon")
+    
     # Test commands to run
-    test_commands = [
-        (
-            f"{python_exe} -m pytest tests/ -v",
-            "Running all tests with verbose output"
-        ),
-        (
-            f"{python_exe} -m pytest tests/ --cov=src --cov-report=term-missing",
-            "Running tests with coverage report"
-        ),
-        (
-            f"{python_exe} -m pytest tests/test_api.py -v",
-            "Running API endpoint tests only"
-        ),
-        (
-            f"{python_exe} -m pytest tests/test_edge_cases.py -v",
-            "Running edge case and error handling tests"
-        ),
-        (
-            f"{python_exe} -m pytest tests/test_static_files.py -v",
-            "Running static file and frontend integration tests"
-        )
-    ]
+    if importlib.util.find_spec("xdist") is not None:
+        if args.coverage:
+            test_commands = [
+                (PARALLEL_ARGS + COVERAGE_ARGS,
+                 "Running all tests in parallel with coverage report")
+            ]
+        else:
+            test_commands = [
+                (PARALLEL_ARGS, "Running all tests in parallel")
+            ]
+    elif args.coverage:
+        # Concurrent shards would race on one coverage data file, so run the
+        # whole suite serially in a single pytest call instead
+        test_commands = [
+            (("tests/", *PLUGIN_ARGS) + COVERAGE_ARGS,
+             "Running all tests with coverage report")
+        ]
+    else:
+        # Without xdist, shard by test module and run the shards side by side
+        test_commands = [
+            (shard_args, f"Running {shard_args[0]}") for shard_args in SHARD_ARGS
+        ]
+    
+    if args.exitfirst:
+        test_commands = [
+            (pytest_args + ("-x",), description)
+            for pytest_args, description in test_commands
+        ]
     
     # Run each test command
     results = []
-    for command, description in test_commands:
-        success = run_command(command, description)
-        results.append((description, success))
+    if len(test_commands) == 1:
+        pytest_args, description = test_commands[0]
+        results.append((description, run_command(pytest_args, description, args.verbose)))
+    else:
+        max_workers = max(1, min(len(test_commands), (os.cpu_count() or 1) - 1))
+        # One shard per worker process: pytest.main() must not run twice in
+        # the same interpreter, since imports and src.app state would carry over
+        with ProcessPoolExecutor(max_workers=max_workers, max_tasks_per_child=1) as executor:
+            futures = {
+                executor.submit(run_command_buffered, pytest_args, description, args.verbose): description
+                for pytest_args, description in test_commands
+            }
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                # Print each shard's output in one piece as it finishes
+                success, output = future.result()
+                sys.stdout.write(output)
+                sys.stdout.flush()
+                results.append((futures[future], success))
+                if args.exitfirst and not success:
+                    # Drop shards that have not started; running ones stop
+                    # at their own first failure because of -x and are still
+                    # reported. Cancelling here, rather than shutting the
+                    # executor down, avoids a hang at interpreter exit.
+                    for pending in futures:
+                        pending.cancel()
     
     # Print summary
     print(f"\n{'='*60}")
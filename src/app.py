@@ -80,6 +80,12 @@ activities = {
     }
 }
 
+# Set of participant emails per activity, kept in sync with the participant
+# lists above so signup/unregister membership checks are O(1)
+participant_sets = {
+    name: set(details["participants"]) for name, details in activities.items()
+}
+
 
 @app.get("/")
 def root():
@@ -101,11 +107,14 @@ def signup_for_activity(activity_name: str, email: str):
     # Get the specific activity
     activity = activities[activity_name]
 
+    participants = participant_sets[activity_name]
+
     # Validate student is not already signed up
-    if email in activity["participants"]:
+    if email in participants:
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
     # Add student
     activity["participants"].append(email)
+    participants.add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -119,10 +128,13 @@ def unregister_from_activity(activity_name: str, email: str):
     # Get the specific activity
     activity = activities[activity_name]
     
+    participants = participant_sets[activity_name]
+    
     # Validate student is signed up
-    if email not in activity["participants"]:
+    if email not in participants:
         raise HTTPException(status_code=400, detail="Student is not registered for this activity")
     
     # Remove student
     activity["participants"].remove(email)
+    participants.discard(email)
     return {"message": f"Unregistered {email} from {activity_name}"}
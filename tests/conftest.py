@@ -1,87 +1,118 @@
 """
 Fixtures and configuration for FastAPI tests
+
+src.app is imported exactly once per process (once per xdist worker) and is
+never reloaded: tests mutate the module-level activities and participant_sets
+in place and restore them via reset_activities, which relies on those objects
+keeping their identity for the whole session.
 """
+import copy
+import functools
+from pathlib import Path
+
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
-from src.app import app, activities
+from src.app import app, activities, participant_sets
 
+STATIC_DIR = Path(__file__).parent.parent / "src" / "static"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+    """Create a test client for the FastAPI app, shared across the session"""
+    # Entering the client keeps one event-loop portal thread open for the whole
+    # session, instead of starting a new one for every request
+    with TestClient(app) as test_client:
+        yield test_client
 
 
-@pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original activities
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Soccer Team": {
-            "description": "Join the school soccer team and compete in matches",
-            "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 18,
-            "participants": ["lucas@mergington.edu", "mia@mergington.edu"]
-        },
-        "Basketball Club": {
-            "description": "Practice basketball skills and play friendly games",
-            "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["liam@mergington.edu", "ava@mergington.edu"]
-        },
-        "Art Workshop": {
-            "description": "Explore painting, drawing, and sculpture techniques",
-            "schedule": "Mondays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["ella@mergington.edu", "jack@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Act in plays and learn stage performance skills",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["chloe@mergington.edu", "noah@mergington.edu"]
-        },
-        "Math Olympiad": {
-            "description": "Prepare for math competitions and solve challenging problems",
-            "schedule": "Fridays, 2:00 PM - 3:30 PM",
-            "max_participants": 10,
-            "participants": ["oliver@mergington.edu", "grace@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore scientific concepts",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 14,
-            "participants": ["benjamin@mergington.edu", "zoe@mergington.edu"]
-        }
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client():
+    """Async client driving the ASGI app directly, shared across the session"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_app(client):
+    """Route one request through the app before the first test runs"""
+    client.get("/activities")
+    yield
+
+
+@pytest.fixture(scope="session")
+def static_assets(client):
+    """Responses for the frontend's static files, fetched once per session"""
+    return {
+        path: client.get(path)
+        for path in ("/static/index.html", "/static/styles.css", "/static/app.js")
     }
-    
-    # Reset activities to original state
+
+
+@pytest.fixture(scope="session")
+def static_bytes():
+    """Raw contents of the frontend's static files, read from disk once"""
+    return {
+        name: (STATIC_DIR / name).read_bytes()
+        for name in ("index.html", "styles.css", "app.js")
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _make_emails(prefix, count):
+    """Build a deterministic tuple of student emails, e.g. student0@mergington.edu"""
+    return tuple(f"{prefix}{i}@mergington.edu" for i in range(count))
+
+
+@pytest.fixture(scope="session")
+def make_emails():
+    """Factory for deterministic student emails, cached per (prefix, count)"""
+    return _make_emails
+
+
+def _add_participant(activity_name, email):
+    """Seed a participant directly, keeping the list and membership set in sync"""
+    activities[activity_name]["participants"].append(email)
+    participant_sets[activity_name].add(email)
+
+
+@pytest.fixture(scope="session")
+def add_participant():
+    """Add a participant without going through the signup endpoint"""
+    return _add_participant
+
+
+@pytest.fixture(scope="session")
+def _activities_snapshot():
+    """Pristine copy of the activities data, taken once per session"""
+    return copy.deepcopy(activities)
+
+
+def _restore_activities(snapshot):
+    """Restore activities in place, copying only the mutable participant lists"""
     activities.clear()
-    activities.update(original_activities)
+    activities.update({
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in snapshot.items()
+    })
+    participant_sets.clear()
+    participant_sets.update({
+        name: set(details["participants"]) for name, details in snapshot.items()
+    })
+
+
+@pytest.fixture
+def reset_activities(_activities_snapshot):
+    """Reset activities to initial state before each test"""
+    _restore_activities(_activities_snapshot)
     
     yield
     
     # Clean up after test (reset again)
-    activities.clear()
-    activities.update(original_activities)
+    _restore_activities(_activities_snapshot)
 
 
 @pytest.fixture
